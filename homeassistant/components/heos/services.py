@@ -1,5 +1,5 @@
 """Services for the HEOS integration."""
-import functools
+from functools import wraps
 import logging
 
 from pyheos import CommandFailedError, Heos, HeosError, const
@@ -27,16 +27,17 @@ HEOS_SIGN_OUT_SCHEMA = vol.Schema({})
 
 def register(hass: HomeAssistantType, controller: Heos):
     """Register HEOS services."""
+    heos_services = HeosServices(controller)
     hass.services.async_register(
         DOMAIN,
         SERVICE_SIGN_IN,
-        functools.partial(_sign_in_handler, controller),
+        heos_services.sign_in,
         schema=HEOS_SIGN_IN_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SIGN_OUT,
-        functools.partial(_sign_out_handler, controller),
+        heos_services.sign_out,
         schema=HEOS_SIGN_OUT_SCHEMA,
     )
 
@@ -47,27 +48,45 @@ def remove(hass: HomeAssistantType):
     hass.services.async_remove(DOMAIN, SERVICE_SIGN_OUT)
 
 
-async def _sign_in_handler(controller, service):
-    """Sign in to the HEOS account."""
-    if controller.connection_state != const.STATE_CONNECTED:
-        _LOGGER.error("Unable to sign in because HEOS is not connected")
-        return
-    username = service.data[ATTR_USERNAME]
-    password = service.data[ATTR_PASSWORD]
-    try:
-        await controller.sign_in(username, password)
-    except CommandFailedError as err:
-        _LOGGER.error("Sign in failed: %s", err)
-    except HeosError as err:
-        _LOGGER.error("Unable to sign in: %s", err)
-
-
-async def _sign_out_handler(controller, service):
-    """Sign out of the HEOS account."""
-    if controller.connection_state != const.STATE_CONNECTED:
-        _LOGGER.error("Unable to sign out because HEOS is not connected")
-        return
-    try:
-        await controller.sign_out()
-    except HeosError as err:
-        _LOGGER.error("Unable to sign out: %s", err)
+def require_connected(command: str):
+    """Return decorator that skips the service call when HEOS is not connected."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, service):
+            if self.controller.connection_state != const.STATE_CONNECTED:
+                _LOGGER.error("Unable to %s because HEOS is not connected", command)
+                return
+            await func(self, service)
+
+        return wrapper
+
+    return decorator
+
+
+class HeosServices:
+    """Handlers for the HEOS services."""
+
+    def __init__(self, controller: Heos):
+        """Init the service handlers."""
+        self.controller = controller
+
+    @require_connected("sign in")
+    async def sign_in(self, service):
+        """Sign in to the HEOS account."""
+        username = service.data[ATTR_USERNAME]
+        password = service.data[ATTR_PASSWORD]
+        try:
+            await self.controller.sign_in(username, password)
+        except CommandFailedError as err:
+            _LOGGER.error("Sign in failed: %s", err)
+        except HeosError as err:
+            _LOGGER.error("Unable to sign in: %s", err)
+
+    @require_connected("sign out")
+    async def sign_out(self, service):
+        """Sign out of the HEOS account."""
+        try:
+            await self.controller.sign_out()
+        except HeosError as err:
+            _LOGGER.error("Unable to sign out: %s", err)